@@ -895,12 +895,15 @@ def groupby_grid(xs, ys, deltax, deltay):
     assert ny > 0, ny
     xbins = get_bins(xs, nx, None, xmin, xmax)[0]
     ybins = get_bins(ys, ny, None, ymin, ymax)[0]
-    acc = AccumDict(accum=[])
-    for p, ij in enumerate(zip(xbins, ybins)):
-        acc[ij].append(p)
+    # NB: the points are grouped by cell with a stable sort on the cell
+    # index; the cells are returned in order of first appearance
+    cells = xbins * (ybins.max() + 1) + ybins
+    order = numpy.argsort(cells, kind='stable')
+    _, starts, counts = numpy.unique(
+        cells[order], return_index=True, return_counts=True)
     dic = {}
-    for (i, j), ps in acc.items():
-        idxs = numpy.array(ps)
+    for c in numpy.argsort(order[starts]):
+        idxs = order[starts[c]:starts[c] + counts[c]]
         dic[xs[idxs].mean(), ys[idxs].mean()] = idxs
     return dic
 
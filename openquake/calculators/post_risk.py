@@ -18,16 +18,17 @@
 
 import os
 import logging
-import itertools
 import numpy
+import pandas
 
-from openquake.baselib import general, parallel, python3compat
+from openquake.baselib import general, parallel, python3compat, hdf5
 from openquake.hazardlib.stats import set_rlzs_stats
 from openquake.commonlib import datastore
 from openquake.risklib import scientific
 from openquake.calculators import base, views
 
 F32 = numpy.float32
+U8 = numpy.uint8
 U16 = numpy.uint16
 U32 = numpy.uint32
 
@@ -67,14 +68,41 @@ def reagg_idxs(num_tags, tagnames):
     >>> list(reagg_idxs(num_tags, ['taxonomy']))  # 4
     [0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 3]
     """
-    shape = list(num_tags.values())
-    T = numpy.prod(shape)
-    arr = numpy.arange(T).reshape(shape)
-    ranges = [numpy.arange(n) if t in tagnames else [slice(None)]
-              for t, n in num_tags.items()]
-    for i, idx in enumerate(itertools.product(*ranges)):
-        arr[idx] = i
-    return arr.flatten()
+    # number the combinations of the kept tags and broadcast the numbers
+    # along the axes of the tags which are not kept
+    shape = [n if t in tagnames else 1 for t, n in num_tags.items()]
+    idxs = numpy.arange(numpy.prod(shape)).reshape(shape)
+    return numpy.broadcast_to(idxs, list(num_tags.values())).flatten()
+
+
+def reaggregate(df, idxs, L):
+    """
+    :param df: a DataFrame with fields event_id, loss_id, agg_id, ...
+    :param idxs: an array of reaggregation indices, one per agg_id
+    :param L: the number of loss types
+    :returns: a DataFrame with the other fields summed by reaggregated keys
+
+    >>> df = pandas.DataFrame(dict(event_id=U32([0, 0, 1]), loss_id=U8(0),
+    ...                            agg_id=U32([0, 1, 2]), loss=F32(1)))
+    >>> reaggregate(df, U32([0, 0, 1]), 1)
+       event_id  loss_id  agg_id  loss
+    0         0        0       0   2.0
+    1         1        0       1   1.0
+    """
+    # NB: a single integer key on (event_id, loss_id, agg_id) and
+    # numpy.bincount are much faster than a pandas groupby on three columns
+    agg_id = idxs[df.agg_id.to_numpy()]
+    A = agg_id.max() + 1
+    key = ((df.event_id.to_numpy().astype(numpy.int64) * L +
+            df.loss_id.to_numpy()) * A + agg_id)
+    uniq, inv = numpy.unique(key, return_inverse=True)
+    dic = dict(event_id=U32(uniq // A // L), loss_id=U8(uniq // A % L),
+               agg_id=U32(uniq % A))
+    for col in df.columns:
+        if col not in dic:
+            dic[col] = numpy.bincount(inv, df[col].to_numpy()).astype(
+                df[col].dtype)
+    return pandas.DataFrame(dic)
 
 
 def get_loss_builder(dstore, return_periods=None, loss_dt=None):
@@ -113,18 +141,31 @@ def get_src_loss_table(dstore, L):
         (source_ids, array of losses of shape (Ns, L))
     """
     K = dstore['risk_by_event'].attrs.get('K', 0)
-    alt = dstore.read_df('risk_by_event', 'agg_id', dict(agg_id=K))
-    eids = alt.event_id.to_numpy()
-    evs = dstore['events'][:][eids]
-    rlz_ids = evs['rlz_id']
-    rup_ids = evs['rup_id']
-    source_id = python3compat.decode(dstore['ruptures']['source_id'][rup_ids])
+    nrows = len(dstore['risk_by_event/agg_id'])
+    events = dstore['events'][:]
+    # NB: decoding only the distinct source IDs is a lot faster than
+    # decoding one source ID per event; the codes are sorted like the IDs
+    uniq, codes = numpy.unique(
+        dstore['ruptures']['source_id'], return_inverse=True)
     w = dstore['weights'][:]
-    acc = general.AccumDict(accum=numpy.zeros(L, F32))
-    for source_id, rlz_id, loss_id, loss in zip(
-            source_id, rlz_ids, alt.loss_id.to_numpy(), alt.loss.to_numpy()):
-        acc[source_id][loss_id] += loss * w[rlz_id]
-    return zip(*sorted(acc.items()))
+    acc = numpy.zeros((len(uniq), L))
+    seen = numpy.zeros(len(uniq), bool)
+    # the sum is associative, so risk_by_event can be read in slices,
+    # thus bounding the memory occupation
+    for slc in general.gen_slices(0, nrows, hdf5.MAX_ROWS):
+        alt = dstore.read_df('risk_by_event', 'agg_id', dict(agg_id=K), slc)
+        if len(alt) == 0:
+            continue
+        evs = events[alt.event_id.to_numpy()]
+        df = pandas.DataFrame(dict(
+            src=codes[evs['rup_id']], loss_id=alt.loss_id.to_numpy(),
+            loss=alt.loss.to_numpy() * w[evs['rlz_id']]))
+        # sum the weighted losses by source and loss type in a single pass
+        tot = df.groupby(['src', 'loss_id']).loss.sum()
+        src = tot.index.get_level_values(0).to_numpy()
+        acc[src, tot.index.get_level_values(1).to_numpy()] += tot.to_numpy()
+        seen[src] = True
+    return python3compat.decode(uniq[seen]), acc[seen].astype(F32)
 
 
 def post_risk(builder, krl_losses, monitor):
@@ -190,12 +231,11 @@ class PostRiskCalculator(base.RiskCalculator):
             rlz_id = numpy.zeros_like(rlz_id)
         alt_df = self.datastore.read_df('risk_by_event')
         if self.reaggreate:
+            # keep the reaggregated agg_id as U32, like in risk_by_event
             idxs = numpy.concatenate([
                 reagg_idxs(self.num_tags, oq.aggregate_by),
-                numpy.array([K], int)])
-            alt_df['agg_id'] = idxs[alt_df['agg_id'].to_numpy()]
-            alt_df = alt_df.groupby(
-                ['event_id', 'loss_id', 'agg_id']).sum().reset_index()
+                numpy.array([K], int)]).astype(U32)
+            alt_df = reaggregate(alt_df, idxs, self.L)
         alt_df['rlz_id'] = rlz_id[alt_df.event_id.to_numpy()]
         units = self.datastore['cost_calculator'].get_units(oq.loss_names)
         smap = parallel.Starmap(post_risk, h5=self.datastore.hdf5)
@@ -206,10 +246,15 @@ class PostRiskCalculator(base.RiskCalculator):
         agg_losses = numpy.zeros((K + 1, self.R, self.L), F32)
         agg_curves = numpy.zeros((K + 1, self.R, self.L, P), F32)
         gb = alt_df.groupby([alt_df.agg_id, alt_df.rlz_id, alt_df.loss_id])
+        # aggregate losses computed in a single vectorized pass
+        tot = gb.loss.sum()
+        kidx, ridx, lidx = (tot.index.get_level_values(i).to_numpy()
+                            for i in range(3))
+        agg_losses[kidx, ridx, lidx] = tot.to_numpy()
         # NB: in the future we may use multiprocessing.shared_memory
-        for (k, r, lni), df in gb:
-            agg_losses[k, r, lni] = df.loss.sum()
-            krl_losses.append((k, r, lni, df.loss.to_numpy()))
+        losses = alt_df.loss.to_numpy()
+        for (k, r, lni), idxs in gb.indices.items():
+            krl_losses.append((k, r, lni, losses[idxs]))
             if len(krl_losses) >= blocksize:
                 smap.submit((builder, krl_losses))
                 krl_losses[:] = []
@@ -254,23 +299,29 @@ class PostRiskCalculator(base.RiskCalculator):
                 kinds = ['rlz-%d' % rlz for rlz in range(self.R)]
             else:
                 kinds = self.oqparam.hazard_stats()
+            # read the datasets once, instead of slicing them for each r, li
+            agg_array = self.datastore[agg][()]  # shape (K+1, R, L)
+            tot_array = agg_array[-1]
+            agg_array = agg_array[:-1].sum(axis=0)
+            try:
+                sum_array = self.datastore[avg][()].sum(axis=0)
+            except KeyError:
+                sum_array = None
             for li in range(self.L):
                 ln = self.oqparam.loss_names[li]
                 for r, k in enumerate(kinds):
-                    tot_losses = self.datastore[agg][-1, r, li]
-                    agg_losses = self.datastore[agg][:-1, r, li].sum()
+                    tot_losses = tot_array[r, li]
+                    agg_losses = agg_array[r, li]
                     if kind == 'rlzs' or k == 'mean':
                         if not numpy.allclose(
                                 agg_losses, tot_losses, rtol=.001):
                             logging.warning(
                                 'Inconsistent total losses for %s, %s: '
                                 '%s != %s', ln, k, agg_losses, tot_losses)
-                        try:
-                            avg_losses = self.datastore[avg][:, r, li]
-                        except KeyError:
+                        if sum_array is None:
                             continue
                         # check on the sum of the average losses
-                        sum_losses = avg_losses.sum()
+                        sum_losses = sum_array[r, li]
                         if not numpy.allclose(
                                 sum_losses, tot_losses, rtol=.001):
                             logging.warning(
@@ -384,7 +384,9 @@ class ContextMaker(object):
                 except FarAwayRupture:
                     continue
                 for par in self.REQUIRES_SITES_PARAMETERS:
-                    setattr(ctx, par, r_sites[par])
+                    # NB: r_sites[par] is a strided view on the site array;
+                    # the gsims work faster on a contiguous copy
+                    setattr(ctx, par, numpy.ascontiguousarray(r_sites[par]))
                 ctx.sids = r_sites.sids
                 ctx.src_id = src_id
                 for par in self.REQUIRES_DISTANCES | {'rrup'}:
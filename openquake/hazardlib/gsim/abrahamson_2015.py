@@ -28,6 +28,7 @@ Module exports :class:`AbrahamsonEtAl2015`
 """
 import numpy as np
 
+from openquake.baselib.performance import jittable, numba
 from openquake.hazardlib.gsim.base import GMPE, CoeffsTable
 from openquake.hazardlib import const
 from openquake.hazardlib.imt import PGA, SA
@@ -61,8 +62,43 @@ def _compute_magterm(C1, theta1, theta4, theta5, theta13, dc1, mag):
     return base + f_mag
 
 
+if numba:
+
+    @jittable
+    def _dist_term(dists, lnr, a, c, d):
+        # compute a * lnr + c * dists + d with numba
+        out = np.empty(len(dists))
+        for i in range(len(dists)):
+            out[i] = a * lnr[i] + c * dists[i] + d
+        return out
+else:
+
+    def _dist_term(dists, lnr, a, c, d):
+        # compute a * lnr + c * dists + d with numpy
+        out = a * lnr
+        out += c * dists
+        out += d
+        return out
+
+
+def _get_log_dist(trt, mag, dists):
+    """
+    Returns the IMT-independent factor log(R + c4 * exp((mag - 6) * theta9))
+    of the distance scaling term, to be computed once per context
+    """
+    if trt == const.TRT.SUBDUCTION_INTERFACE:
+        dists = dists.rrup
+    elif trt == const.TRT.SUBDUCTION_INTRASLAB:
+        dists = dists.rhypo
+    else:
+        raise NotImplementedError(trt)
+    out = np.add(dists, CONSTS['c4'] * np.exp((mag - 6.) * CONSTS['theta9']))
+    np.log(out, out=out)
+    return out
+
+
 # theta6_adj used in BCHydro
-def _compute_disterm(trt, C1, theta2, theta14, theta3, mag, dists, c4, theta9,
+def _compute_disterm(trt, C1, theta2, theta14, theta3, mag, dists, lnr,
                      theta6_adj, theta6, theta10):
     if trt == const.TRT.SUBDUCTION_INTERFACE:
         dists = dists.rrup
@@ -71,9 +107,8 @@ def _compute_disterm(trt, C1, theta2, theta14, theta3, mag, dists, c4, theta9,
         dists = dists.rhypo
     else:
         raise NotImplementedError(trt)
-    return ((theta2 + theta14 + theta3 * (mag - C1)) * np.log(
-        dists + c4 * np.exp((mag - 6.) * theta9)) +
-            ((theta6_adj + theta6) * dists)) + theta10
+    a = theta2 + theta14 + theta3 * (mag - C1)
+    return _dist_term(dists, lnr, a, theta6_adj + theta6, theta10)
 
 
 def _compute_forearc_backarc_term(trt, faba_model, C, sites, dists):
@@ -102,28 +137,21 @@ def _compute_forearc_backarc_term(trt, faba_model, C, sites, dists):
     return f_faba * faba_model(-sites.xvf)
 
 
-def _get_stddevs(ergodic, C, stddev_types, num_sites):
+def _get_stddevs(ergodic, C):
     """
-    Return standard deviations as defined in Table 3
+    Return total, inter-event and intra-event standard deviations as
+    defined in Table 3
     """
-    stddevs = []
-    for stddev_type in stddev_types:
-        if stddev_type == const.StdDev.TOTAL:
-            sigma = C["sigma"] if ergodic else C["sigma_ss"]
-            stddevs.append(sigma + np.zeros(num_sites))
-        elif stddev_type == const.StdDev.INTER_EVENT:
-            stddevs.append(C['tau'] + np.zeros(num_sites))
-        elif stddev_type == const.StdDev.INTRA_EVENT:
-            if ergodic:
-                phi = C["phi"]
-            else:
-                # Get single station phi
-                phi = np.sqrt(C["sigma_ss"] ** 2. - C["tau"] ** 2.)
-            stddevs.append(phi + np.zeros(num_sites))
-    return stddevs
+    sigma = C["sigma"] if ergodic else C["sigma_ss"]
+    if ergodic:
+        phi = C["phi"]
+    else:
+        # Get single station phi
+        phi = np.sqrt(C["sigma_ss"] ** 2. - C["tau"] ** 2.)
+    return sigma, C['tau'], phi
 
 
-def _compute_distance_term(kind, trt, theta6_adj, C, mag, dists):
+def _compute_distance_term(kind, trt, theta6_adj, C, mag, dists, lnr):
     """
     Computes the distance scaling term, as contained within equation (1)
     """
@@ -137,13 +165,12 @@ def _compute_distance_term(kind, trt, theta6_adj, C, mag, dists):
         C1 = 7.8
     if trt == const.TRT.SUBDUCTION_INTERFACE:
         return _compute_disterm(
-            trt, C1, C['theta2'], 0., theta3, mag, dists, CONSTS['c4'],
-            CONSTS['theta9'], theta6_adj, C['theta6'], theta10=0.)
+            trt, C1, C['theta2'], 0., theta3, mag, dists, lnr,
+            theta6_adj, C['theta6'], theta10=0.)
     else:  # sslab
         return _compute_disterm(
-            trt, C1, C['theta2'], C['theta14'], theta3, mag, dists,
-            CONSTS['c4'], CONSTS['theta9'], theta6_adj, C['theta6'],
-            C["theta10"])
+            trt, C1, C['theta2'], C['theta14'], theta3, mag, dists, lnr,
+            theta6_adj, C['theta6'], C["theta10"])
 
 
 def _compute_focal_depth_term(trt, C, rup):
@@ -181,13 +208,14 @@ def _compute_magnitude_term(kind, C, dc1, mag):
 
 
 def _compute_pga_rock(kind, trt, theta6_adj, faba_model,
-                      C, dc1, sites, rup, dists):
+                      C, dc1, sites, rup, dists, lnr):
     """
     Compute and return mean imt value for rock conditions
     (vs30 = 1000 m/s)
     """
     mean = (_compute_magnitude_term(kind, C, dc1, rup.mag) +
-            _compute_distance_term(kind, trt, theta6_adj, C, rup.mag, dists) +
+            _compute_distance_term(kind, trt, theta6_adj, C, rup.mag, dists,
+                                   lnr) +
             _compute_focal_depth_term(trt, C, rup) +
             _compute_forearc_backarc_term(trt, faba_model, C, sites, dists))
     # Apply linear site term
@@ -277,35 +305,39 @@ class AbrahamsonEtAl2015SInter(GMPE):
         super().__init__(**kwargs)
         self.ergodic = kwargs.get('ergodic', True)
 
-    def get_mean_and_stddevs(self, sites, rup, dists, imt, stddev_types):
+    def compute(self, ctx, imts, mean, sig, tau, phi):
         """
         See :meth:`superclass method
-        <.base.GroundShakingIntensityModel.get_mean_and_stddevs>`
+        <.base.GroundShakingIntensityModel.compute>`
         for spec of input and result values.
         """
-        # extract dictionaries of coefficients specific to required
-        # intensity measure type and for PGA
-        C = self.COEFFS[imt]
         C_PGA = self.COEFFS[PGA()]
         if self.delta_c1 is None:
-            dc1 = self.COEFFS_MAG_SCALE[imt]["dc1"]
             dc1_pga = self.COEFFS_MAG_SCALE[PGA()]["dc1"]
         else:
-            dc1 = dc1_pga = self.delta_c1
+            dc1_pga = self.delta_c1
+        # NB: the logarithmic distance factor is the same for all IMTs
+        lnr = _get_log_dist(self.trt, ctx.mag, ctx)
         # compute median pga on rock (vs30=1000), needed for site response
         # term calculation
         pga1000 = np.exp(_compute_pga_rock(
             self.kind, self.trt, self.theta6_adj, self.faba_model,
-            C_PGA, dc1_pga, sites, rup, dists))
-        mean = (_compute_magnitude_term(self.kind, C, dc1, rup.mag) +
+            C_PGA, dc1_pga, ctx, ctx, ctx, lnr))
+        for m, imt in enumerate(imts):
+            C = self.COEFFS[imt]
+            if self.delta_c1 is None:
+                dc1 = self.COEFFS_MAG_SCALE[imt]["dc1"]
+            else:
+                dc1 = self.delta_c1
+            mean[m] = (
+                _compute_magnitude_term(self.kind, C, dc1, ctx.mag) +
                 _compute_distance_term(self.kind, self.trt, self.theta6_adj,
-                                       C, rup.mag, dists) +
-                _compute_focal_depth_term(self.trt, C, rup) +
+                                       C, ctx.mag, ctx, lnr) +
+                _compute_focal_depth_term(self.trt, C, ctx) +
                 _compute_forearc_backarc_term(self.trt, self.faba_model,
-                                              C, sites, dists) +
-                _compute_site_response_term(C, sites, pga1000))
-        stddevs = _get_stddevs(self.ergodic, C, stddev_types, len(sites.vs30))
-        return mean, stddevs
+                                              C, ctx, ctx) +
+                _compute_site_response_term(C, ctx, pga1000))
+            sig[m], tau[m], phi[m] = _get_stddevs(self.ergodic, C)
 
     # Period-dependent coefficients (Table 3)
     COEFFS = CoeffsTable(sa_damping=5, table="""\
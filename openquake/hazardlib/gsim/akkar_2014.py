@@ -215,7 +215,8 @@ class AkkarEtAlRjb2014(GMPE):
 
         stddevs = _get_stddevs(C, stddev_types, num_sites=sites.vs30.size)
 
-        return mean + self.adjustment_factor, stddevs
+        mean += self.adjustment_factor
+        return mean, stddevs
 
     #: c1 is the reference magnitude, fixed to 6.75Mw (which happens to be the
     #: same value used in Boore and Atkinson, 2008)
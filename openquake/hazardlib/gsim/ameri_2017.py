@@ -294,7 +294,8 @@ class AmeriEtAl2017Rjb(GMPE):
             self.__class__.__name__,
             C_SIGMA, stddev_types, len(sites.vs30), rup.mag)
         stddevs = np.log(10.0 ** np.array(istddevs))
-        return mean + self.adjustment_factor, stddevs
+        mean += self.adjustment_factor
+        return mean, stddevs
 
 
     #: Coefficients from Table "10518_2017_171_MOESM2_ESM.xlsx" in electronic supplementary material:
@@ -451,7 +452,8 @@ class AmeriEtAl2017RjbStressDrop(AmeriEtAl2017Rjb):
             self.__class__.__name__, C_SIGMA, stddev_types,
             len(sites.vs30), None)
         stddevs = np.log(10.0 ** np.array(istddevs))
-        return mean + self.adjustment_factor, stddevs
+        mean += self.adjustment_factor
+        return mean, stddevs
 
 
 class AmeriEtAl2017Repi(AmeriEtAl2017Rjb):
@@ -595,7 +597,8 @@ class AmeriEtAl2017RepiStressDrop(AmeriEtAl2017Repi):
             self.__class__.__name__, C_SIGMA, stddev_types,
             len(sites.vs30), None)
         stddevs = np.log(10.0 ** np.array(istddevs))
-        return mean + self.adjustment_factor, stddevs
+        mean += self.adjustment_factor
+        return mean, stddevs
 
 
 class Ameri2014Rjb(AmeriEtAl2017Rjb):
@@ -370,7 +370,7 @@ class GroundShakingIntensityModel(metaclass=MetaGSIM):
             vars(ctx).update(vars(dists))
         else:
             ctx = rup
-        self.compute(rup, [imt], mean, sig, tau, phi)
+        self.compute(ctx, [imt], mean, sig, tau, phi)
         stddevs = []
         for stddev_type in stddev_types:
             if stddev_type == const.StdDev.TOTAL:
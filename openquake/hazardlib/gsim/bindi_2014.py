@@ -218,7 +218,8 @@ class BindiEtAl2014Rjb(GMPE):
 
         istddevs = _get_stddevs(C, stddev_types, len(sites.vs30))
         stddevs = np.log(10.0 ** np.array(istddevs))
-        return mean + self.adjustment_factor, stddevs
+        mean += self.adjustment_factor
+        return mean, stddevs
 
     #: Coefficients from Table 2
 
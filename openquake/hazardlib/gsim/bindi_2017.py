@@ -159,7 +159,8 @@ class BindiEtAl2017Rjb(GMPE):
         # Mean is returned in terms of m/s^2. Need to convert to g
         mean -= np.log(g)
         stddevs = get_stddevs(C, sites.vs30.shape, stddev_types)
-        return mean + self.adjustment_factor, stddevs
+        mean += self.adjustment_factor
+        return mean, stddevs
 
     # Joyner-Boore
     COEFFS = CoeffsTable(sa_damping=5, table="""\
@@ -56,16 +56,14 @@ def _compute_mean(clsname, sof, adjustment_factor, C, rup, dists, sites, imt):
                 clsname, sof, C, sites.vs30))
     # convert from cm/s**2 to g for SA and from cm/s**2 to g for PGA (PGV
     # is already in cm/s) and also convert from base 10 to base e.
+    # NB: the unit conversion is a scalar factor, i.e. a shift in log space
     if imt.string == "PGA":
-        mean = np.log((10 ** mean) * ((2 * np.pi / 0.01) ** 2) *
-                      1e-2 / g)
+        mean += np.log10(((2 * np.pi / 0.01) ** 2) * 1e-2 / g)
     elif imt.string[:2] == "SA":
-        mean = np.log((10 ** mean) * ((2 * np.pi / imt.period) ** 2) *
-                      1e-2 / g)
-    else:
-        mean = np.log(10 ** mean)
-
-    return mean + adjustment_factor
+        mean += np.log10(((2 * np.pi / imt.period) ** 2) * 1e-2 / g)
+    mean *= np.log(10.)
+    mean += adjustment_factor
+    return mean
 
 
 def _get_distance_scaling_term(C, mag, rrup):
@@ -561,7 +559,7 @@ def rhypo_to_rrup(rhypo, mag):
     dependent on the magnitude
     """
     rrup = rhypo - (0.7108 + 2.496E-6 * (mag ** 7.982))
-    rrup[rrup < 3.0] = 3.0
+    np.maximum(rrup, 3.0, out=rrup)
     return rrup
 
 
@@ -46,11 +46,12 @@ def rhypo_to_rjb(rhypo, mag):
     Converts hypocentral distance to an equivalent Joyner-Boore distance
     dependent on the magnitude
     """
-    epsilon = rhypo - (4.853 + 1.347E-6 * (mag ** 8.163))
-    rjb = np.zeros_like(rhypo)
-    idx = epsilon >= 3.
-    rjb[idx] = np.sqrt((epsilon[idx] ** 2.) - 9.0)
-    rjb[rjb < 0.0] = 0.0
+    rjb = rhypo - (4.853 + 1.347E-6 * (mag ** 8.163))
+    # NB: clipping epsilon at 3 gives rjb = 0 below the threshold
+    np.maximum(rjb, 3., out=rjb)
+    rjb *= rjb
+    rjb -= 9.0
+    np.sqrt(rjb, out=rjb)
     return rjb
 
 
@@ -166,17 +167,16 @@ def get_mean(region, W_1, B_1, C, rup, sites, dists):
     sof = _get_sof_dummy_variable(rup.rake)
     # Get the normalised coefficients
     p_n = get_pn(region,  rup, sites, dists, sof)
-    mean = np.zeros_like(dists.rhypo if region == "germany" else dists.rjb)
-    # Need to loop over sites - maybe this can be improved in future?
-    # ndenumerate is used to allow for application to 2-D arrays
-    for idx, rval in np.ndenumerate(p_n[0]):
-        # Place normalised coefficients into a single array
-        p_n_i = np.array([rval, p_n[1], p_n[2][idx], p_n[3], p_n[4]])
-        # Executes the main ANN model
-        mean_i = np.dot(w_2, np.tanh(np.dot(W_1, p_n_i) + B_1))
-        mean[idx] = (0.5 * (mean_i + C["B_2"] + 1.0) *
-                     (C["tmax"] - C["tmin"])) + C["tmin"]
-    return mean
+    # Place the normalised coefficients into a single (5, N) array, with
+    # the scalar ones broadcast over the sites; the reshape is used to allow
+    # for application to 2-D arrays
+    shape = np.shape(p_n[0])
+    p_n = np.array([np.broadcast_to(p, shape) for p in p_n]).reshape(5, -1)
+    # Executes the main ANN model for all sites at once
+    mean = np.dot(w_2, np.tanh(np.dot(W_1, p_n) + B_1[:, None]))[0]
+    mean = (0.5 * (mean + C["B_2"] + 1.0) *
+            (C["tmax"] - C["tmin"])) + C["tmin"]
+    return mean.reshape(shape)
 
 
 def get_stddevs(C, n_sites, stddev_types):
@@ -211,9 +211,8 @@ class DerrasEtAl2014(GMPE):
     is modelled via a hyperbolic tangent-sigmoid function which is then applied
     to the vector of normalised predictor variables. As a consequence the
     expected ground motion for each site is derived from a set of matrix
-    products from the respective weighting and bias vectors. This means that
-    vectorisation by sites cannot be achieved and a loop is implemented
-    instead.
+    products from the respective weighting and bias vectors, which are
+    evaluated for all the sites at once.
     """
     region = "base"
 
@@ -383,4 +382,5 @@ class DerrasEtAl2014RhypoGermany(DerrasEtAl2014):
 
         # Get the standard deviations
         stddevs = get_stddevs(C, mean.shape, stddev_types)
-        return mean + self.adjustment_factor, stddevs
+        mean += self.adjustment_factor
+        return mean, stddevs
@@ -25,8 +25,8 @@ from openquake.hazardlib.imt import PGA, SA
 from openquake.hazardlib import const
 from openquake.hazardlib.gsim.nga_east import (
     get_tau_at_quantile, get_phi_ss_at_quantile, TAU_EXECUTION, TAU_SETUP,
-    PHI_SETUP, get_phi_ss, NGAEastGMPE, _get_f760, get_nonlinear_stddev,
-    _get_fv, get_fnl)
+    PHI_SETUP, get_phi_ss, NGAEastGMPE, _get_f760, get_linear_stddev,
+    get_nonlinear_stddev, _get_fv, get_fnl)
 from openquake.hazardlib.gsim.usgs_ceus_2019 import get_stewart_2019_phis2s
 
 CONSTANTS = {"Mref": 4.5, "Rref": 1., "Mh": 6.2, "h": 5.0}
@@ -97,19 +97,15 @@ def get_site_amplification(site_epsilon, imt, pga_r, sites):
         # In the case of the linear model sigma_f760 and sigma_fv are
         # assumed independent and the resulting sigma_flin is the root
         # sum of squares (SRSS)
-        f760_stddev = _get_f760(C_F760, sites.vs30,
-                                NGAEastGMPE.CONSTANTS,
-                                is_stddev=True)
-        f_lin_stddev = np.sqrt(
-            f760_stddev ** 2. +
-            NGAEastGMPE.get_linear_stddev(
-                C_LIN, sites.vs30, NGAEastGMPE.CONSTANTS) ** 2)
         # Likewise, the epistemic uncertainty on the linear and nonlinear
         # model are assumed independent and the SRSS is taken
-        f_nl_stddev = get_nonlinear_stddev(
-            C_NL, sites.vs30) * f_rk
-        site_epistemic = np.sqrt(f_lin_stddev ** 2. + f_nl_stddev ** 2.)
-        ampl += (site_epsilon * site_epistemic)
+        # NB: the SRSS of an SRSS is the SRSS of all the terms
+        var = _get_f760(C_F760, sites.vs30, NGAEastGMPE.CONSTANTS,
+                        is_stddev=True) ** 2
+        var += get_linear_stddev(
+            C_LIN, sites.vs30, NGAEastGMPE.CONSTANTS) ** 2
+        var += (get_nonlinear_stddev(C_NL, sites.vs30) * f_rk) ** 2
+        ampl += (site_epsilon * np.sqrt(var))
     return ampl
 
 
@@ -263,7 +259,8 @@ class ESHM20Craton(GMPE):
             mean = get_hard_rock_mean(C, rctx, dctx)
         else:
             # Avoid re-calculating PGA if that was already done!
-            mean = np.copy(pga_r)
+            # NB: no copy is needed, pga_r is not used after the update
+            mean = pga_r
 
         mean += get_site_amplification(
             self.site_epsilon, imt, np.exp(pga_r), sctx)
@@ -442,7 +442,8 @@ class KothaEtAl2020(GMPE):
                               sites, imt, rup.mag)
         if self.dl2l:
             # The source-region parameter is specified explicity
-            return mean + self.dl2l[imt]["dl2l"], stddevs
+            mean += self.dl2l[imt]["dl2l"]
+            return mean, stddevs
 
         if self.sigma_mu_epsilon:
             # Apply the epistemic uncertainty factor (sigma_mu) multiplied by
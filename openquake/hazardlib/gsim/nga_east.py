@@ -359,11 +359,12 @@ def _get_f760(C_F760, vs30, CONSTANTS, is_stddev=False):
     factors: for impedence and for gradient conditions. The weighting
     model is described by equations 5 - 7 of Stewart et al. (2019)
     """
+    # NB: clipping vs30 to [vw2, vw1] gives the constant weights wt2 and
+    # wt1 outside of the transition range
+    vs = np.clip(vs30, CONSTANTS["vw2"], CONSTANTS["vw1"])
     wimp = (CONSTANTS["wt1"] - CONSTANTS["wt2"]) *\
-        (np.log(vs30 / CONSTANTS["vw2"]) /
+        (np.log(vs / CONSTANTS["vw2"]) /
          np.log(CONSTANTS["vw1"] / CONSTANTS["vw2"])) + CONSTANTS["wt2"]
-    wimp[vs30 >= CONSTANTS["vw1"]] = CONSTANTS["wt1"]
-    wimp[vs30 < CONSTANTS["vw2"]] = CONSTANTS["wt2"]
     wgr = 1.0 - wimp
     if is_stddev:
         return wimp * C_F760["f760is"] + wgr * C_F760["f760gs"]
@@ -376,20 +377,18 @@ def _get_fv(C_LIN, sites, f760, CONSTANTS):
     Returns the Vs30-dependent component of the mean linear amplification
     model, as defined in equation 3 of Stewart et al. (2019)
     """
-    const1 = C_LIN["c"] * np.log(C_LIN["v1"] / CONSTANTS["vref"])
     const2 = C_LIN["c"] * np.log(C_LIN["v2"] / CONSTANTS["vref"])
-    f_v = C_LIN["c"] * np.log(sites.vs30 / CONSTANTS["vref"])
-    f_v[sites.vs30 <= C_LIN["v1"]] = const1
-    f_v[sites.vs30 > C_LIN["v2"]] = const2
-    idx = sites.vs30 > CONSTANTS["vU"]
-    if np.any(idx):
-        const3 = np.log(3000. / CONSTANTS["vU"])
-        f_v[idx] = const2 - (const2 + f760[idx]) *\
-            (np.log(sites.vs30[idx] / CONSTANTS["vU"]) / const3)
-    idx = sites.vs30 >= 3000.
-    if np.any(idx):
-        f_v[idx] = -f760[idx]
-    return f_v + f760
+    # NB: clipping vs30 to [v1, v2] gives the constant branches of the
+    # model below v1 and above v2 in a single pass
+    f_v = np.clip(sites.vs30, C_LIN["v1"], C_LIN["v2"])
+    f_v /= CONSTANTS["vref"]
+    np.log(f_v, out=f_v)
+    f_v *= C_LIN["c"]
+    f_v += f760
+    # above vU the amplification decays logarithmically to zero at 3000 m/s
+    vU = CONSTANTS["vU"]
+    w = 1. - np.log(np.clip(sites.vs30, vU, 3000.) / vU) / np.log(3000. / vU)
+    return np.where(sites.vs30 > vU, (const2 + f760) * w, f_v)
 
 
 def get_fnl(C_NL, pga_rock, vs30, period):
@@ -401,17 +400,16 @@ def get_fnl(C_NL, pga_rock, vs30, period):
         vref = 760.
     else:
         vref = 3000.
-    f_nl = np.zeros(vs30.shape)
     f_rk = np.log((pga_rock + C_NL["f3"]) / C_NL["f3"])
-    idx = vs30 < C_NL["Vc"]
-    if np.any(idx):
-        # f2 term of the mean nonlinear amplification model
-        # according to equation 3 of Hashash et al., (2019)
-        c_vs = np.copy(vs30[idx])
-        c_vs[c_vs > vref] = vref
-        f_2 = C_NL["f4"] * (np.exp(C_NL["f5"] * (c_vs - 360.)) -
-                            np.exp(C_NL["f5"] * (vref - 360.)))
-        f_nl[idx] = f_2 * f_rk[idx]
+    # f2 term of the mean nonlinear amplification model
+    # according to equation 3 of Hashash et al., (2019)
+    f_2 = np.minimum(vs30, vref)
+    f_2 -= 360.
+    f_2 *= C_NL["f5"]
+    np.exp(f_2, out=f_2)
+    f_2 -= np.exp(C_NL["f5"] * (vref - 360.))
+    f_2 *= C_NL["f4"]
+    f_nl = np.where(vs30 < C_NL["Vc"], f_2 * f_rk, 0.)
     return f_nl, f_rk
 
 
@@ -420,26 +418,19 @@ def get_linear_stddev(C_LIN, vs30, CONSTANTS):
     Returns the standard deviation of the linear amplification function,
     as defined in equation 4 of Stewart et al., (2019)
     """
-    sigma_v = C_LIN["sigma_vc"] + np.zeros(vs30.shape)
-    idx = vs30 < C_LIN["vf"]
-    if np.any(idx):
-        dsig = C_LIN["sigma_L"] - C_LIN["sigma_vc"]
-        d_v = (vs30[idx] - CONSTANTS["vL"]) /\
-            (C_LIN["vf"] - CONSTANTS["vL"])
-        sigma_v[idx] = C_LIN["sigma_L"] - (2. * dsig * d_v) +\
-            dsig * (d_v ** 2.)
-    idx = np.logical_and(vs30 > C_LIN["v2"], vs30 <= CONSTANTS["vU"])
-    if np.any(idx):
-        d_v = (vs30[idx] - C_LIN["v2"]) / (CONSTANTS["vU"] - C_LIN["v2"])
-        sigma_v[idx] = C_LIN["sigma_vc"] + \
-            (C_LIN["sigma_U"] - C_LIN["sigma_vc"]) * (d_v ** 2.)
-    idx = vs30 >= CONSTANTS["vU"]
-    if np.any(idx):
-        sigma_v[idx] = C_LIN["sigma_U"] *\
-            (1. - (np.log(vs30[idx] / CONSTANTS["vU"]) /
-                   np.log(3000. / CONSTANTS["vU"])))
-    sigma_v[vs30 > 3000.] = 0.0
-    return sigma_v
+    vL, vU = CONSTANTS["vL"], CONSTANTS["vU"]
+    # NB: the quadratic tapers below vf and above v2 reach sigma_vc at
+    # d_v = 1 and d_v = 0 respectively, so clipping d_v gives the constant
+    # branch in between without any masking
+    dsig = C_LIN["sigma_L"] - C_LIN["sigma_vc"]
+    d_v = np.minimum((vs30 - vL) / (C_LIN["vf"] - vL), 1.)
+    sigma_v = C_LIN["sigma_L"] - dsig * d_v * (2. - d_v)
+    d_v = np.clip((vs30 - C_LIN["v2"]) / (vU - C_LIN["v2"]), 0., 1.)
+    sigma_v += (C_LIN["sigma_U"] - C_LIN["sigma_vc"]) * d_v * d_v
+    # above vU the sigma decays logarithmically to zero at 3000 m/s
+    sigma_u = C_LIN["sigma_U"] * (
+        1. - np.log(np.clip(vs30, vU, 3000.) / vU) / np.log(3000. / vU))
+    return np.where(vs30 >= vU, sigma_u, sigma_v)
 
 
 def get_nonlinear_stddev(C_NL, vs30):
@@ -447,13 +438,10 @@ def get_nonlinear_stddev(C_NL, vs30):
     Returns the standard deviation of the nonlinear amplification function,
     as defined in equation 2.5 of Hashash et al. (2017)
     """
-    sigma_f2 = np.zeros(vs30.shape)
-    sigma_f2[vs30 < 300.] = C_NL["sigma_c"]
-    idx = np.logical_and(vs30 >= 300, vs30 < 1000)
-    if np.any(idx):
-        sigma_f2[idx] = (-C_NL["sigma_c"] / np.log(1000. / 300.)) *\
-            np.log(vs30[idx] / 300.) + C_NL["sigma_c"]
-    return sigma_f2
+    # NB: clipping vs30 to [300, 1000] gives sigma_c below 300 m/s and
+    # zero from 1000 m/s upwards
+    return C_NL["sigma_c"] * (
+        1. - np.log(np.clip(vs30, 300., 1000.) / 300.) / np.log(1000. / 300.))
 
 
 def get_hard_rock_mean(self, rctx, dctx, imt, stddev_types):
@@ -511,15 +499,14 @@ def get_site_amplification_sigma(self, sites, f_rk, C_LIN, C_F760, C_NL):
     # In the case of the linear model sigma_f760 and sigma_fv are
     # assumed independent and the resulting sigma_flin is the root
     # sum of squares (SRSS)
-    f760_stddev = _get_f760(C_F760, sites.vs30,
-                            self.CONSTANTS, is_stddev=True)
-    f_lin_stddev = np.sqrt(
-        f760_stddev ** 2. +
-        get_linear_stddev(C_LIN, sites.vs30, self.CONSTANTS) ** 2)
     # Likewise, the epistemic uncertainty on the linear and nonlinear
     # model are assumed independent and the SRSS is taken
-    f_nl_stddev = get_nonlinear_stddev(C_NL, sites.vs30) * f_rk
-    return np.sqrt(f_lin_stddev ** 2. + f_nl_stddev ** 2.)
+    # NB: the SRSS of an SRSS is the SRSS of all the terms, so only
+    # one square root is needed
+    var = _get_f760(C_F760, sites.vs30, self.CONSTANTS, is_stddev=True) ** 2
+    var += get_linear_stddev(C_LIN, sites.vs30, self.CONSTANTS) ** 2
+    var += (get_nonlinear_stddev(C_NL, sites.vs30) * f_rk) ** 2
+    return np.sqrt(var)
 
 
 def get_stddevs(self, mag, imt, stddev_types, num_sites):
@@ -718,13 +705,14 @@ class NGAEastGMPE(GMPETable):
         pga_r = get_hard_rock_mean(self, rctx, dctx, rock_imt, stddev_types)
 
         # Get the desired spectral acceleration on rock
-        if imt.string != "PGA":
+        if imt.string == "PGA" or imt == rock_imt:
+            # Avoid re-calculating PGA if that was already done!
+            # NB: no copy is needed, pga_r is not used after the update
+            mean = pga_r
+        else:
             # Calculate the ground motion at required spectral period for
             # the reference rock
             mean = get_hard_rock_mean(self, rctx, dctx, imt, stddev_types)
-        else:
-            # Avoid re-calculating PGA if that was already done!
-            mean = np.copy(pga_r)
 
         mean += get_site_amplification(self, imt, np.exp(pga_r), sctx)
         # Get standard deviation model
@@ -26,31 +26,35 @@ from openquake.hazardlib.gsim.base import GMPE, CoeffsTable
 from openquake.hazardlib import const
 from openquake.hazardlib.imt import PGA, PGV, SA
 
+LN10 = np.log(10.0)
 
-def _get_stddevs(C, stddev_types, num_sites):
+
+def _get_stddevs(C):
+    """
+    Return the total, inter-event and intra-event standard deviations
+    as defined in table 1, converted to natural logarithm.
+    """
+    # NB: ln(10 ** x) = x * ln(10)
+    return (C['epsilon'] * LN10, C['tau'] * LN10, C['sigma'] * LN10)
+
+
+def _get_distance_factors(dists):
     """
-    Return standard deviations as defined in table 1.
+    Returns the IMT-independent factors logR and R-Rref of the distance
+    term in equation 3
     """
-    stddevs = []
-    for stddev_type in stddev_types:
-        if stddev_type == const.StdDev.TOTAL:
-            stddevs.append(C['epsilon'] + np.zeros(num_sites))
-        elif stddev_type == const.StdDev.INTRA_EVENT:
-            stddevs.append(C['sigma'] + np.zeros(num_sites))
-        elif stddev_type == const.StdDev.INTER_EVENT:
-            stddevs.append(C['tau'] + np.zeros(num_sites))
-    return stddevs
+    rref = 1.0
+    return np.log10(dists.rhypo), dists.rhypo - rref
 
 
-def _compute_distance(rup, dists, C):
+def _compute_distance(C, log_r, d_r):
     """
     equation 3 pag 1960:
 
     ``c31 * logR + c32 * (R-Rref)``
     """
-    rref = 1.0
     c31 = -1.7
-    return (c31 * np.log10(dists.rhypo) + C['c32'] * (dists.rhypo - rref))
+    return (c31 * log_r + C['c32'] * d_r)
 
 
 def _compute_magnitude(rup, C):
@@ -72,78 +76,45 @@ def _get_site_amplification(sites, C):
     while S and SS are dummy variables used to denote NEHRP site category
     C and D respectively
     Coefficents for categories A and B are set to zero
-    """
-    S, SS = _get_site_type_dummy_variables(sites)
-
-    return (C['c61'] * S) + (C['c62'] * SS)
-
 
-def _get_site_type_dummy_variables(sites):
-    """
-    Get site type dummy variables, three different site classes,
-    based on the shear wave velocity intervals in the uppermost 30 m, Vs30,
-    according to the NEHRP:
+    The site classes are based on the shear wave velocity intervals in the
+    uppermost 30 m, Vs30, according to the NEHRP:
     class A-B: Vs30 > 760 m/s
     class C: Vs30 = 360 − 760 m/s
     class D: Vs30 < 360 m/s
-
     """
-    S = np.zeros(len(sites.vs30))
-    SS = np.zeros(len(sites.vs30))
-
-    # Class C; 180 m/s <= Vs30 <= 360 m/s.
-    idx = (sites.vs30 < 360.0)
-    SS[idx] = 1.0
-    # Class B; 360 m/s <= Vs30 <= 760 m/s. (NEHRP)
-    idx = (sites.vs30 >= 360.0) & (sites.vs30 < 760)
-    S[idx] = 1.0
+    # NB: the dummy variables are mutually exclusive, so the amplification
+    # is just c62 for class D, c61 for class C and zero otherwise
+    return np.where(sites.vs30 < 360.0, C['c62'],
+                    np.where(sites.vs30 < 760, C['c61'], 0.))
 
-    return S, SS
 
-
-def _compute_forearc_backarc_term(C, sites, dists, rup):
+def _get_fhr(rhypo):
     """
-    Compute back-arc term of Equation 3
+    Returns the distance function FHR of the back-arc term of Equation 3
+    for hypocentral depths of 80 km or more: zero up to 140 km, decreasing
+    linearly as (140 - R) / 100 up to 240 km and one from 240 km onwards.
 
+    For shallower events the ramp runs from 205 to 335 km with a width of
+    150 km, but there the Heaviside function H (H0 = 100 km) cancels the
+    whole back-arc term, so it is never needed.
     """
-    # flag 1 (R < 335 & R >= 205)
-    flag1 = np.zeros(len(dists.rhypo))
-    ind1 = np.logical_and((dists.rhypo < 335), (dists.rhypo >= 205))
-    flag1[ind1] = 1.0
-    # flag 2 (R >= 335)
-    flag2 = np.zeros(len(dists.rhypo))
-    ind2 = (dists.rhypo >= 335)
-    flag2[ind2] = 1.0
-    # flag 3 (R < 240 & R >= 140)
-    flag3 = np.zeros(len(dists.rhypo))
-    ind3 = np.logical_and((dists.rhypo < 240), (dists.rhypo >= 140))
-    flag3[ind3] = 1.0
-    # flag 4 (R >= 240)
-    flag4 = np.zeros(len(dists.rhypo))
-    ind4 = (dists.rhypo >= 240)
-    flag4[ind4] = 1.0
-
-    A = flag1 * ((205 - dists.rhypo)/150) + flag2
-    B = flag3 * ((140 - dists.rhypo)/100) + flag4
-    if (rup.hypo_depth < 80):
-        FHR = A
-    else:
-        FHR = B
+    return np.where(rhypo >= 240., 1.,
+                    (140. - np.clip(rhypo, 140., 240.)) / 100.)
 
-    H0 = 100
-    # Heaviside function
-    if (rup.hypo_depth >= H0):
-        H = 1
-    else:
-        H = 0
 
+def _compute_forearc_backarc_term(C, sites, fhr):
+    """
+    Compute back-arc term of Equation 3 for hypocentral depths where the
+    Heaviside function H is one (depth >= H0 = 100 km); otherwise the term
+    is zero
+    """
     # ARC = 0 for back-arc - ARC = 1 for forearc
-    ARC = np.zeros(len(sites.backarc))
-    idxarc = (sites.backarc == 1)
-    ARC[idxarc] = 1.0
-
-    return ((C['c41'] * (1 - ARC) * H) + (C['c42'] * (1 - ARC) * H * FHR) +
-            (C['c51'] * ARC * H) + (C['c52'] * ARC * H * FHR))
+    # NB: since ARC is a 0/1 indicator the four terms
+    # c41 (1 - ARC) H + c42 (1 - ARC) H FHR + c51 ARC H + c52 ARC H FHR
+    # reduce to a selection between (c41 + c42 FHR) and (c51 + c52 FHR)
+    return np.where(sites.backarc == 1, C['c51'] + C['c52'] * fhr,
+                    C['c41'] + C['c42'] * fhr)
 
 
 class SkarlatoudisEtAlSSlab2013(GMPE):
@@ -185,34 +156,40 @@ class SkarlatoudisEtAlSSlab2013(GMPE):
     #: Required distance measure is Rhypo.
     REQUIRES_DISTANCES = {'rhypo'}
 
-    def get_mean_and_stddevs(self, sites, rup, dists, imt, stddev_types):
+    def compute(self, ctx, imts, mean, sig, tau, phi):
         """
         See :meth:`superclass method
-        <.base.GroundShakingIntensityModel.get_mean_and_stddevs>`
+        <.base.GroundShakingIntensityModel.compute>`
         for spec of input and result values.
         """
-        # extracting dictionary of coefficients specific to required
-        # intensity measure type.
-
-        C = self.COEFFS[imt]
-        imean = (_compute_magnitude(rup, C) +
-                 _compute_distance(rup, dists, C) +
-                 _get_site_amplification(sites, C) +
-                 _compute_forearc_backarc_term(C, sites, dists, rup))
-
-        istddevs = _get_stddevs(C, stddev_types, len(sites.vs30))
-
-        # Convert units to g,
-        # but only for PGA and SA (not PGV):
-        if imt.string.startswith(("SA", "PGA")):
-            mean = np.log((10.0 ** (imean - 2.0)) / g)
-        else:
-            # PGV:
-            mean = np.log(10.0 ** imean)
-        # Return stddevs in terms of natural log scaling
-        stddevs = np.log(10.0 ** np.array(istddevs))
-        # mean_LogNaturale = np.log((10 ** mean) * 1e-2 / g)
-        return mean, stddevs
+        # NB: the distance factors are the same for all IMTs
+        log_r, d_r = _get_distance_factors(ctx)
+        # the back-arc term is switched on by the Heaviside function H
+        # only for hypocentral depths of 100 km or more
+        H0 = 100.
+        deep = ctx.hypo_depth >= H0
+        if deep:
+            fhr = _get_fhr(ctx.rhypo)
+        for m, imt in enumerate(imts):
+            # extracting dictionary of coefficients specific to required
+            # intensity measure type.
+            C = self.COEFFS[imt]
+            # NB: the terms are accumulated in-place in the output row
+            mean[m] = _compute_distance(C, log_r, d_r)
+            mean[m] += _compute_magnitude(ctx, C)
+            mean[m] += _get_site_amplification(ctx, C)
+            if deep:
+                mean[m] += _compute_forearc_backarc_term(C, ctx, fhr)
+
+            # Convert from log10 to natural logarithm and the units to g,
+            # but only for PGA and SA (not PGV):
+            # NB: ln(10 ** x / (100 g)) = x * ln(10) - ln(100 g)
+            mean[m] *= LN10
+            if imt.string.startswith(("SA", "PGA")):
+                mean[m] -= np.log(100.0 * g)
+            # Return stddevs in terms of natural log scaling
+            sig[m], tau[m], phi[m] = _get_stddevs(C)
+
     #: Coefficients from SA from Table 1
     #: Coefficients from PGA e PGV from Table 5
 
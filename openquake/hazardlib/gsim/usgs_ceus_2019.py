@@ -266,13 +266,14 @@ class NGAEastUSGSGMPE(NGAEastGMPE):
         pga_r = get_hard_rock_mean(self, rctx, dctx, rock_imt, stddev_types)
 
         # Get the desired spectral acceleration on rock
-        if not str(imt) == "PGA":
+        if imt.string == "PGA" or imt == rock_imt:
+            # Avoid re-calculating PGA if that was already done!
+            # NB: no copy is needed, imean is never updated in-place
+            imean = pga_r
+        else:
             # Calculate the ground motion at required spectral period for
             # the reference rock
             imean = get_hard_rock_mean(self, rctx, dctx, imt, stddev_types)
-        else:
-            # Avoid re-calculating PGA if that was already done!
-            imean = np.copy(pga_r)
 
         # Get the coefficients for the IMT
         C_LIN = self.COEFFS_LINEAR[imt]
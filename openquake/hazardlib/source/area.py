@@ -19,7 +19,8 @@ Module :mod:`openquake.hazardlib.source.area` defines :class:`AreaSource`.
 import math
 from copy import deepcopy
 from openquake.hazardlib import geo, mfd
-from openquake.hazardlib.source.point import PointSource
+from openquake.hazardlib.source.point import (
+    PointSource, _get_rupture_dimensions)
 from openquake.hazardlib.source.base import ParametricSeismicSource
 from openquake.hazardlib.source.rupture import ParametricProbabilisticRupture
 
@@ -98,6 +99,7 @@ class AreaSource(ParametricSeismicSource):
         ref_ruptures = []
         for mag, mag_occ_rate in self.get_annual_occurrence_rates():
             for np_prob, np in self.nodal_plane_distribution.data:
+                dims = _get_rupture_dimensions(self, mag, np.rake, np.dip)
                 for hc_prob, hc_depth in self.hypocenter_distribution.data:
                     hypocenter = geo.Point(latitude=epicenter0.latitude,
                                            longitude=epicenter0.longitude,
@@ -105,7 +107,7 @@ class AreaSource(ParametricSeismicSource):
                     occurrence_rate = (mag_occ_rate * np_prob * hc_prob
                                        * scaling_rate_factor)
                     surface, nhc = PointSource._get_rupture_surface(
-                        self, mag, np, hypocenter)
+                        self, mag, np, hypocenter, dims)
                     if kwargs.get('shift_hypo'):
                         hc_depth = nhc.depth
                     ref_ruptures.append((mag, np.rake, hc_depth,
@@ -71,6 +71,11 @@ def _get_rupture_dimensions(src, mag, rake, dip):
     return rup_length, rup_width
 
 
+AVG_KEYS = ('lon', 'lat', 'dep', 'strike', 'dip', 'rake',
+            'upper_seismogenic_depth', 'lower_seismogenic_depth',
+            'rupture_aspect_ratio')
+
+
 def msr_name(src):
     """
     :returns: the name of MSR class or "Undefined" if not applicable
@@ -87,9 +92,7 @@ def calc_average(pointsources):
         a dict with average strike, dip, rake, lon, lat, dep,
         upper_seismogenic_depth, lower_seismogenic_depth
     """
-    acc = dict(lon=[], lat=[], dep=[], strike=[], dip=[], rake=[],
-               upper_seismogenic_depth=[], lower_seismogenic_depth=[],
-               rupture_aspect_ratio=[])
+    rows = []
     rates = []
     trt = pointsources[0].tectonic_region_type
     msr = msr_name(pointsources[0])
@@ -97,22 +100,23 @@ def calc_average(pointsources):
         assert src.tectonic_region_type == trt
         assert msr_name(src) == msr
         rates.append(sum(r for m, r in src.get_annual_occurrence_rates()))
-        ws, ds = zip(*src.nodal_plane_distribution.data)
-        strike = numpy.average([np.strike for np in ds], weights=ws)
-        dip = numpy.average([np.dip for np in ds], weights=ws)
-        rake = numpy.average([np.rake for np in ds], weights=ws)
+        ws, nps = zip(*src.nodal_plane_distribution.data)
+        ws = numpy.array(ws)
+        sdr = numpy.array([[np.strike for np in nps], [np.dip for np in nps],
+                           [np.rake for np in nps]])
+        strike, dip, rake = (sdr * ws).sum(axis=1) / ws.sum()
         ws, deps = zip(*src.hypocenter_distribution.data)
-        dep = numpy.average(deps, weights=ws)
-        acc['lon'].append(src.location.x)
-        acc['lat'].append(src.location.y)
-        acc['dep'].append(dep)
-        acc['strike'].append(strike)
-        acc['dip'].append(dip)
-        acc['rake'].append(rake)
-        acc['upper_seismogenic_depth'].append(src.upper_seismogenic_depth)
-        acc['lower_seismogenic_depth'].append(src.lower_seismogenic_depth)
-        acc['rupture_aspect_ratio'].append(src.rupture_aspect_ratio)
-    dic = {key: numpy.average(acc[key], weights=rates) for key in acc}
+        ws = numpy.array(ws)
+        dep = (numpy.array(deps) * ws).sum() / ws.sum()
+        rows.append((src.location.x, src.location.y, dep, strike, dip, rake,
+                     src.upper_seismogenic_depth, src.lower_seismogenic_depth,
+                     src.rupture_aspect_ratio))
+    # NB: a single weighted average on the (9, N) array of columns,
+    # C-ordered so that each column is summed contiguously
+    cols = numpy.ascontiguousarray(numpy.array(rows).T)
+    rates = numpy.array(rates)
+    avg = (cols * rates).sum(axis=1) / rates.sum()
+    dic = dict(zip(AVG_KEYS, avg))
     dic['lon'] = numpy.round(dic['lon'], 6)
     dic['lat'] = numpy.round(dic['lat'], 6)
     return dic
@@ -192,6 +196,11 @@ class PointSource(ParametricSeismicSource):
         :returns:
             Half of maximum rupture's diagonal surface projection.
         """
+        # NB: the radius for the maximum magnitude is cached, keyed on the
+        # magnitude range, since the MFD can be modified by the logic tree
+        key = None if mag is not None else self.get_min_max_mag()
+        if key is not None and key == getattr(self, '_radius_key', None):
+            return self.radius
         if mag is None:
             mag, _rate = self.get_annual_occurrence_rates()[-1]
         radius = []
@@ -202,6 +211,7 @@ class PointSource(ParametricSeismicSource):
             # the projection radius is half of the rupture diagonal
             radius.append(math.sqrt(rup_length ** 2 + rup_width ** 2) / 2.0)
         self.radius = max(radius)
+        self._radius_key = key
         return self.radius
 
     def iter_ruptures(self, **kwargs):
@@ -210,16 +220,21 @@ class PointSource(ParametricSeismicSource):
         and hypocenter depth.
         """
         filtermag = kwargs.get('mag')
+        # NB: the hypocenters do not depend on the magnitude and nodal plane
+        hcs = [(hc_prob, Point(latitude=self.location.latitude,
+                               longitude=self.location.longitude,
+                               depth=hc_depth))
+               for hc_prob, hc_depth in self.hypocenter_distribution.data]
         for mag, mag_occ_rate in self.get_annual_occurrence_rates():
             if filtermag and mag != filtermag:
                 continue  # yield only ruptures of magnitude filtermag
             for np_prob, np in self.nodal_plane_distribution.data:
-                for hc_prob, hc_depth in self.hypocenter_distribution.data:
-                    hc = Point(latitude=self.location.latitude,
-                               longitude=self.location.longitude,
-                               depth=hc_depth)
+                # NB: the rupture dimensions do not depend on the hypocenter
+                dims = _get_rupture_dimensions(self, mag, np.rake, np.dip)
+                for hc_prob, hc in hcs:
                     occurrence_rate = mag_occ_rate * np_prob * hc_prob
-                    surface, nhc = self._get_rupture_surface(mag, np, hc)
+                    surface, nhc = self._get_rupture_surface(
+                        mag, np, hc, dims)
                     yield ParametricProbabilisticRupture(
                         mag, np.rake, self.tectonic_region_type,
                         nhc if kwargs.get('shift_hypo') else hc,
@@ -254,7 +269,7 @@ class PointSource(ParametricSeismicSource):
         """
         return len(self.get_annual_occurrence_rates()) * self.count_nphc()
 
-    def _get_rupture_surface(self, mag, nodal_plane, hypocenter):
+    def _get_rupture_surface(self, mag, nodal_plane, hypocenter, dims=None):
         """
         Create and return rupture surface object with given properties.
 
@@ -266,6 +281,9 @@ class PointSource(ParametricSeismicSource):
             describing the rupture orientation.
         :param hypocenter:
             Point representing rupture's hypocenter.
+        :param dims:
+            Pair (rupture length, rupture width) as returned by
+            :func:`_get_rupture_dimensions`; computed if not given.
         :returns:
             Instance of :class:`~openquake.hazardlib.geo.surface.planar.PlanarSurface`.
         """
@@ -284,8 +302,10 @@ class PointSource(ParametricSeismicSource):
         azimuth_left = (azimuth_down + 90) % 360
         azimuth_up = (azimuth_left + 90) % 360
 
-        rup_length, rup_width = _get_rupture_dimensions(
-            self, mag, nodal_plane.rake, nodal_plane.dip)
+        if dims is None:
+            dims = _get_rupture_dimensions(
+                self, mag, nodal_plane.rake, nodal_plane.dip)
+        rup_length, rup_width = dims
         # calculate the height of the rupture being projected
         # on the vertical plane:
         rup_proj_height = rup_width * math.sin(rdip)
@@ -338,22 +358,20 @@ class PointSource(ParametricSeismicSource):
         hor_dist = math.sqrt(
             (rup_length / 2.) ** 2 + (rup_proj_width / 2.) ** 2)
 
-        left_top = rupture_center.point_at(
-            horizontal_distance=hor_dist,
-            vertical_increment=-rup_proj_height / 2.,
-            azimuth=(nodal_plane.strike + 180 + theta) % 360)
-        right_top = rupture_center.point_at(
-            horizontal_distance=hor_dist,
-            vertical_increment=-rup_proj_height / 2.,
-            azimuth=(nodal_plane.strike - theta) % 360)
-        left_bottom = rupture_center.point_at(
-            horizontal_distance=hor_dist,
-            vertical_increment=rup_proj_height / 2.,
-            azimuth=(nodal_plane.strike + 180 - theta) % 360)
-        right_bottom = rupture_center.point_at(
-            horizontal_distance=hor_dist,
-            vertical_increment=rup_proj_height / 2.,
-            azimuth=(nodal_plane.strike + theta) % 360)
+        # NB: the four corners are computed with a single vectorized call
+        # in the order left_top, right_top, left_bottom, right_bottom
+        strike = nodal_plane.strike
+        azimuths = numpy.array([strike + 180 + theta, strike - theta,
+                                strike + 180 - theta, strike + theta]) % 360
+        lons, lats = geodetic.point_at(
+            rupture_center.longitude, rupture_center.latitude,
+            azimuths, hor_dist)
+        top_depth = rupture_center.depth - hheight
+        bottom_depth = rupture_center.depth + hheight
+        left_top = Point(lons[0], lats[0], top_depth)
+        right_top = Point(lons[1], lats[1], top_depth)
+        left_bottom = Point(lons[2], lats[2], bottom_depth)
+        right_bottom = Point(lons[3], lats[3], bottom_depth)
         surface = PlanarSurface(
             nodal_plane.strike, nodal_plane.dip, left_top, right_top,
             right_bottom, left_bottom)
@@ -402,21 +420,24 @@ class CollapsedPointSource(PointSource):
             pointsources[0].temporal_occurrence_model)
         vars(self).update(calc_average(pointsources))
         self.location = Point(self.lon, self.lat, self.dep)
+        acc = AccumDict(accum=0)
+        for psource in pointsources:
+            acc += dict(psource.get_annual_occurrence_rates())
+        self._mag_rates = sorted(acc.items())
+        self._num_ruptures = sum(src.count_ruptures() for src in pointsources)
+        self._nphc = sum(src.count_nphc() for src in pointsources)
 
     def get_annual_occurrence_rates(self):
         """
         :returns: a list of pairs [(mag, mag_occur_rate), ...]
         """
-        acc = AccumDict(accum=0)
-        for psource in self.pointsources:
-            acc += dict(psource.get_annual_occurrence_rates())
-        return sorted(acc.items())
+        return self._mag_rates
 
     def count_nphc(self):
         """
         :returns: the total number of nodal planes and hypocenters
         """
-        return sum(src.count_nphc() for src in self.pointsources)
+        return self._nphc
 
     def iter_ruptures(self, **kwargs):
         """
@@ -445,6 +466,11 @@ class CollapsedPointSource(PointSource):
         :returns:
             Half of maximum rupture's diagonal surface projection.
         """
+        # NB: the underlying sources do not change, so the radius for the
+        # maximum magnitude is computed only once
+        if mag is None and getattr(self, '_radius_key', None):
+            return self.radius
+        key = mag is None
         if mag is None:
             mag, _rate = self.get_annual_occurrence_rates()[-1]
         rup_length, rup_width = _get_rupture_dimensions(
@@ -452,21 +478,22 @@ class CollapsedPointSource(PointSource):
         rup_width = rup_width * math.cos(math.radians(self.dip))
         # the projection radius is half of the rupture diagonal
         self.radius = math.sqrt(rup_length ** 2 + rup_width ** 2) / 2.0
+        self._radius_key = key
         return self.radius
 
     def count_ruptures(self):
         """
         :returns: the total number of underlying ruptures
         """
-        return sum(src.count_ruptures() for src in self.pointsources)
+        return self._num_ruptures
 
 
 def _coords(psources):
-    arr = numpy.zeros((len(psources), 3))
-    for p, psource in enumerate(psources):
-        arr[p, 0] = psource.location.x
-        arr[p, 1] = psource.location.y
-        arr[p, 2] = psource.location.z
+    locs = [psource.location for psource in psources]
+    arr = numpy.empty((len(locs), 3))
+    arr[:, 0] = [loc.longitude for loc in locs]
+    arr[:, 1] = [loc.latitude for loc in locs]
+    arr[:, 2] = [loc.depth for loc in locs]
     return arr
 
 
@@ -112,8 +112,10 @@ def calc_momenta(array, weights):
     :returns: an array of shape (2, ...) with the first two statistical moments
     """
     momenta = numpy.zeros((2,) + array.shape[1:])
-    momenta[0] = numpy.einsum('i,i...', weights, array)
-    momenta[1] = numpy.einsum('i,i...', weights, array**2)
+    # NB: numpy.dot on the 2D view goes through BLAS, unlike einsum
+    arr = array.reshape(len(array), -1)
+    momenta[0] = numpy.dot(weights, arr).reshape(array.shape[1:])
+    momenta[1] = numpy.dot(weights, arr * arr).reshape(array.shape[1:])
     return momenta
 
 
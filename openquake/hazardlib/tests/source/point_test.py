@@ -430,6 +430,19 @@ class PointSourceMaxRupProjRadiusTestCase(unittest.TestCase):
         radius = source._get_max_rupture_projection_radius()
         self.assertAlmostEqual(radius, 3.8712214)
 
+    def test_modified_mfd(self):
+        # the cached radius must be recomputed if the max_mag changes
+        mfd = TruncatedGRMFD(a_val=1, b_val=2, min_mag=3,
+                             max_mag=5, bin_width=1)
+        np_dist = PMF([(0.5, NodalPlane(1, 20, 3)),
+                       (0.5, NodalPlane(2, 2, 4))])
+        source = make_point_source(nodal_plane_distribution=np_dist, mfd=mfd)
+        radius = source._get_max_rupture_projection_radius()
+        self.assertAlmostEqual(radius, 1.2830362)
+        source.mfd.modify('set_max_mag', dict(value=6))
+        radius = source._get_max_rupture_projection_radius()
+        self.assertAlmostEqual(radius, 4.0573169)
+
 
 class CollapsedPointSourceTestCase(unittest.TestCase):
     def test(self):
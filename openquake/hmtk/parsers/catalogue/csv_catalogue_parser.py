@@ -65,25 +65,47 @@ class CsvCatalogueParser(BaseCatalogueParser):
     def read_file(self, start_year=None, end_year=None):
         """
         """
-        filedata = open(self.input_file, 'r')
         catalogue = self._setup_catalogue()
-        # Reading the data file
-        data = csv.DictReader(filedata)
-        # Parsing the data content
-        for irow, row in enumerate(data):
-            if irow == 0:
-                valid_key_list = self._header_check(
-                    row.keys(),
-                    catalogue.TOTAL_ATTRIBUTE_LIST)
-            for key in valid_key_list:
-                if key in catalogue.FLOAT_ATTRIBUTE_LIST:
-                    catalogue.data[key] = self._float_check(
-                        catalogue.data[key], row[key], irow, key)
-                elif key in catalogue.INT_ATTRIBUTE_LIST:
-                    catalogue.data[key] = self._int_check(
-                        catalogue.data[key], row[key], irow, key)
-                else:
-                    catalogue.data[key].append(row[key])
+        # Reading the data file; the rows are read as lists and the
+        # columns are looked up by index, as csv.DictReader would build
+        # a dictionary for each row
+        with open(self.input_file, 'r') as filedata:
+            data = csv.reader(filedata)
+            header = next(data, [])
+            # the last column wins in case of duplicated names, as in
+            # csv.DictReader
+            column = {key: col for col, key in enumerate(header)}
+            ncols = len(header)
+            rows = (row for row in data if row)  # skip blank lines
+            # Parsing the data content; the values are collected in lists
+            # and stacked on the catalogue arrays only once at the end
+            values = {}
+            for irow, row in enumerate(rows):
+                if irow == 0:
+                    valid_key_list = self._header_check(
+                        column, catalogue.TOTAL_ATTRIBUTE_LIST)
+                    values = {key: [] for key in valid_key_list}
+                    columns = []
+                    for key in valid_key_list:
+                        if key in catalogue.FLOAT_ATTRIBUTE_LIST:
+                            check = self._float_check
+                        elif key in catalogue.INT_ATTRIBUTE_LIST:
+                            check = self._int_check
+                        else:
+                            check = None
+                        columns.append((key, column[key], check))
+                if len(row) < ncols:  # missing values at the end
+                    row += [None] * (ncols - len(row))
+                for key, col, check in columns:
+                    if check:
+                        values[key].append(check(row[col], irow, key))
+                    else:
+                        values[key].append(row[col])
+        for key, vals in values.items():
+            if isinstance(catalogue.data[key], np.ndarray):
+                catalogue.data[key] = np.hstack([catalogue.data[key], vals])
+            else:
+                catalogue.data[key].extend(vals)
         if start_year:
             catalogue.start_year = start_year
         else:
@@ -111,36 +133,34 @@ class CsvCatalogueParser(BaseCatalogueParser):
                       'a recognised catalogue key' % element)
         return valid_key_list
 
-    def _float_check(self, attribute_array, value, irow, key):
-        '''Checks if value is valid float, appends to array if valid, appends
-        nan if not'''
+    def _float_check(self, value, irow, key):
+        '''Checks if value is valid float, returns it if valid, returns
+        nan if empty'''
         value = value.strip(' ')
         try:
             if value:
-                attribute_array = np.hstack([attribute_array, float(value)])
+                return float(value)
             else:
-                attribute_array = np.hstack([attribute_array, np.nan])
+                return np.nan
         except:
             print(irow, key)
             msg = 'Input file format error at line: %d' % (irow + 2)
             msg += ' key: %s' % (key)
             raise ValueError(msg)
-        return attribute_array
 
-    def _int_check(self, attribute_array, value, irow, key):
-        '''Checks if value is valid integer, appends to array if valid, appends
-        nan if not'''
+    def _int_check(self, value, irow, key):
+        '''Checks if value is valid integer, returns it if valid, returns
+        nan if empty'''
         value = value.strip(' ')
         try:
             if value:
-                attribute_array = np.hstack([attribute_array, int(value)])
+                return int(value)
             else:
-                attribute_array = np.hstack([attribute_array, np.nan])
+                return np.nan
         except:
             msg = 'Input file format error at line: %d' % (irow + 2)
             msg += ' key: %s' % (key)
             raise ValueError(msg)
-        return attribute_array
 
 
 class GCMTCsvCatalogueParser(CsvCatalogueParser):